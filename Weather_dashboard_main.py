@@ -1,18 +1,40 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
+import time
+from array import array
+from itertools import zip_longest
 from pathlib import Path
 from datetime import datetime, date
 
 from PySide6.QtCore import (
-    Qt, QUrl, QAbstractTableModel, QModelIndex, QTimer, QSettings, QPointF
+    Qt, QUrl, QAbstractTableModel, QModelIndex, QTimer, QSettings, QPointF, QEvent,
+    QObject, QRunnable, QThreadPool, Signal
 )
-from PySide6.QtGui import QPainter, QPen, QColor, QBrush
+from PySide6.QtGui import QImage, QPainter, QPainterPath, QPen, QColor, QBrush
 from PySide6.QtWidgets import (
     QApplication, QWidget, QLineEdit, QPushButton, QLabel, QVBoxLayout, QHBoxLayout,
     QTableView, QComboBox, QFrame, QMessageBox, QFileDialog, QHeaderView, QAbstractItemView
 )
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkDiskCache, QNetworkRequest
+
+# orjson is optional: it parses bytes directly and is much faster than stdlib json
+try:
+    import orjson
+
+    def _json_loads(data: bytes):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _json_loads(data: bytes):
+        return json.loads(data)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
 
 # -------------------------- API endpoints --------------------------
 OPEN_METEO_GEOCODE = (
@@ -25,17 +47,88 @@ OPEN_METEO_FORECAST = (
     "&daily=weathercode,temperature_2m_max,temperature_2m_min,sunrise,sunset,uv_index_max"
     "&current_weather=true&timezone=auto&temperature_unit={tunit}&windspeed_unit={wunit}"
 )
+GEOCACHE_MAX = 64
+
+# 12-hour clock labels indexed by hour; minutes are filled in with .format(m=...)
+HOUR12 = [f"{((h - 1) % 12) + 1}:{{m:02d}} {'AM' if h < 12 else 'PM'}" for h in range(24)]
+
+# rounded readings repeat a lot, so their labels are cached by int value
+@functools.lru_cache(maxsize=256)
+def _fmt0(i: int) -> str:
+    return str(i)
+
+@functools.lru_cache(maxsize=256)
+def _fmt_deg(i: int) -> str:
+    return f"{i}°"
+
+# -------------------------- Weather codes --------------------------
+# WMO weather code -> condition / emoji, built once so lookups are a tuple index
+_CODE_COND = ["default"] * 100
+_CODE_EMOJI = ["🌤️"] * 100
+_CODE_COND[0], _CODE_EMOJI[0] = "clear", "☀️"
+for _c in (1, 2, 3): _CODE_COND[_c], _CODE_EMOJI[_c] = "clouds", "⛅️"
+for _c in (45, 48): _CODE_COND[_c], _CODE_EMOJI[_c] = "fog", "🌫️"
+for _c in range(51, 68):
+    _CODE_COND[_c] = "drizzle" if _c < 61 else "rain"
+    _CODE_EMOJI[_c] = "🌦️" if _c < 61 else "🌧️"
+for _c in range(71, 78): _CODE_COND[_c], _CODE_EMOJI[_c] = "snow", "🌨️"
+for _c in range(80, 83): _CODE_COND[_c], _CODE_EMOJI[_c] = "showers", "🌧️"
+for _c in range(95, 100): _CODE_COND[_c], _CODE_EMOJI[_c] = "storm", "⛈️"
+_CODE_COND, _CODE_EMOJI = tuple(_CODE_COND), tuple(_CODE_EMOJI)
+del _c
+
+@functools.lru_cache(maxsize=128)
+def _condition_from_code(code: int) -> str:
+    return _CODE_COND[code] if 0 <= code < 100 else "default"
+
+@functools.lru_cache(maxsize=128)
+def _emoji_from_code(code: int) -> str:
+    return _CODE_EMOJI[code] if 0 <= code < 100 else "🌤️"
+
+# -------------------------- Theme --------------------------
+_BG_GRADIENTS = {
+    "clear":   "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #87CEFA, stop:1 #FFE69A)",
+    "clouds":  "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #c9d6df, stop:1 #f0f3f5)",
+    "rain":    "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #5a8bbb, stop:1 #2f4858)",
+    "drizzle": "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #9bbad1, stop:1 #6d8299)",
+    "snow":    "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #e6f2ff, stop:1 #cfe0f5)",
+    "fog":     "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #d7d7d7, stop:1 #eeeeee)",
+    "showers": "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #7393B3, stop:1 #4b6584)",
+    "storm":   "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #2b2d42, stop:1 #4b4e6d)",
+    "default": "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #dde6f1, stop:1 #eef2f7)"
+}
+BG_QSS = "\n".join(
+    [f'QFrame#bg[cond="{c}"] {{ background: {g}; }}' for c, g in _BG_GRADIENTS.items()] + [
+        "QFrame#bg { border-radius: 12px; padding: 18px; }",
+        "QLabel { font-size: 22px; }",
+        "QFrame#dailyCard { background: rgba(255,255,255,0.07); border-radius: 10px; }",
+    ]
+)
+_SPARK_ACCENT = QColor("#5aa0ff")
+_SPARK_ACCENT_WET = QColor("#6ec3ff")
 
 # -------------------------- Hourly model --------------------------
 class HourlyModel(QAbstractTableModel):
     HEADERS = ["Time", "Temp", "Precip%", "Wind"]
+    _ALIGN = Qt.AlignCenter
+    _ACCENT = QBrush(QColor(255, 255, 255, 18))
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._rows: list[dict] = []
+        # columnar storage: hour per row plus a preformatted display table
+        self._hours = array("b")
+        self._disp: list[tuple[str, ...]] = []
+        self._tooltips: list[str | None] = []
+        self._now_hour = datetime.now().hour
+
+        # refresh the current-hour highlight once a minute
+        self._hour_timer = QTimer(self)
+        self._hour_timer.setInterval(60_000)
+        self._hour_timer.timeout.connect(self._tick_hour)
+        self._hour_timer.start()
 
     def rowCount(self, *_):
-        return len(self._rows)
+        return len(self._disp)
 
     def columnCount(self, *_):
         return 4
@@ -48,44 +141,62 @@ class HourlyModel(QAbstractTableModel):
     def data(self, index: QModelIndex, role=Qt.DisplayRole):
         if not index.isValid():
             return None
-        r = self._rows[index.row()]
-        c = index.column()
+        i = index.row()
 
         if role == Qt.DisplayRole:
-            if c == 0: return r["time"]
-            if c == 1: return f"{r['temp']:.0f}°"
-            if c == 2: return f"{r['precip']:.0f}"
-            if c == 3: return f"{r['wind']:.0f}"
+            return self._disp[i][index.column()]
 
         if role == Qt.TextAlignmentRole:
-            return Qt.AlignCenter
+            return self._ALIGN
 
         if role == Qt.BackgroundRole:
             # subtle accent for current hour
-            try:
-                hr = datetime.strptime(r["time"], "%I:%M %p").hour
-                if hr == datetime.now().hour:
-                    return QBrush(QColor(255, 255, 255, 18))
-            except Exception:
-                pass
+            if self._hours[i] == self._now_hour:
+                return self._ACCENT
 
         if role == Qt.ToolTipRole:
-            return f"{r['time']}\nTemp {r['temp']:.0f}°, Wind {r['wind']:.0f}, Precip {r['precip']:.0f}%"
+            # built on first hover, then served from the cache
+            tip = self._tooltips[i]
+            if tip is None:
+                time_s, t, pr, w = self._disp[i]
+                tip = self._tooltips[i] = f"{time_s}\nTemp {t}, Wind {w}, Precip {pr}%"
+            return tip
 
         return None
 
     def load(self, rows: list[dict]):
+        hours, disp = array("b"), []
+        for r in rows:
+            hours.append(r.get("hour", -1))
+            # display strings are formatted once here instead of on every repaint
+            t = _fmt_deg(round(r["temp"]))
+            pr = _fmt0(round(r["precip"]))
+            w = _fmt0(round(r["wind"]))
+            disp.append((r["time"], t, pr, w))
         self.beginResetModel()
-        self._rows = rows
+        self._hours, self._disp = hours, disp
+        self._tooltips = [None] * len(disp)
         self.endResetModel()
 
+    def _tick_hour(self):
+        hr = datetime.now().hour
+        if hr == self._now_hour:
+            return
+        self._now_hour = hr
+        if self._disp:
+            last = len(self._disp) - 1
+            self.dataChanged.emit(self.index(0, 0), self.index(last, self.columnCount() - 1),
+                                  [Qt.BackgroundRole])
+
 # -------------------------- Sparkline --------------------------
 class Sparkline(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._values: list[float] = []
         self._pts: list[QPointF] = []
-        self._accent = QColor("#5aa0ff")
+        self._path = QPainterPath()
+        self._accent = _SPARK_ACCENT
+        self._pen = QPen(self._accent, 2.0)
         self.setMinimumHeight(60)
 
     def set_points(self, y_values: list[float]):
@@ -93,7 +204,8 @@ class Sparkline(QFrame):
         self._recompute()
 
     def set_theme(self, condition: str):
-        self._accent = QColor("#5aa0ff") if condition in ("clear", "clouds") else QColor("#6ec3ff")
+        self._accent = _SPARK_ACCENT if condition in ("clear", "clouds") else _SPARK_ACCENT_WET
+        self._pen = QPen(self._accent, 2.0)
         self.update()
 
     def resizeEvent(self, e):
@@ -102,6 +214,7 @@ class Sparkline(QFrame):
 
     def _recompute(self):
         self._pts.clear()
+        self._path = QPainterPath()
         if not self._values:
             self.update(); return
         w = max(1, self.width() - 24)
@@ -113,19 +226,38 @@ class Sparkline(QFrame):
             x = 12 + i * step
             yy = 12 + h - ((y - y_min) / dy) * h
             self._pts.append(QPointF(x, yy))
+        self._path.moveTo(self._pts[0])
+        for pt in self._pts[1:]:
+            self._path.lineTo(pt)
         self.update()
 
     def paintEvent(self, _):
         p = QPainter(self)
         p.setRenderHint(QPainter.Antialiasing, True)
         if len(self._pts) >= 2:
-            p.setPen(QPen(self._accent, 2.0))
-            for i in range(1, len(self._pts)):
-                p.drawLine(self._pts[i - 1], self._pts[i])
+            p.setPen(self._pen)
+            p.drawPath(self._path)
             p.setBrush(self._accent)
             p.drawEllipse(self._pts[-1], 3.5, 3.5)
         p.end()
 
+# -------------------------- PNG export --------------------------
+class _PngSignals(QObject):
+    done = Signal(str, bool)
+
+class PngSaver(QRunnable):
+    """Encodes a grabbed frame to PNG on the thread pool, off the GUI thread."""
+
+    def __init__(self, image: QImage, path: str):
+        super().__init__()
+        self.image = image
+        self.path = path
+        self.signals = _PngSignals()
+
+    def run(self):
+        ok = self.image.save(self.path, "PNG")
+        self.signals.done.emit(self.path, ok)
+
 # -------------------------- App --------------------------
 class WeatherApp(QWidget):
     def __init__(self):
@@ -133,14 +265,30 @@ class WeatherApp(QWidget):
         self.setWindowTitle("Weather Dashboard")
         self.manager = QNetworkAccessManager(self)
         self.manager.finished.connect(self._on_reply)
+        self.manager.setTransferTimeout(15000)
 
         # persistence
         self.prefs_dir = Path.home() / ".config" / "WeatherDash"
         self.prefs_dir.mkdir(parents=True, exist_ok=True)
+
+        # http cache: PreferNetwork still serves fresh copies from disk and revalidates stale ones
+        cache = QNetworkDiskCache(self)
+        cache.setCacheDirectory(str(self.prefs_dir / "httpcache"))
+        cache.setMaximumCacheSize(8 * 1024 * 1024)
+        self.manager.setCache(cache)
+
         self.prefs_path = self.prefs_dir / "prefs.json"
+        self.geocache_path = self.prefs_dir / "geocache.json"
         self.prefs = {"favorites": [], "last_city": "", "unit": "F"}
+        self.geocache: dict[str, list] = {}
         self._load_prefs()
 
+        # coalesce bursts of pref changes into one write
+        self._prefs_dirty_timer = QTimer(self)
+        self._prefs_dirty_timer.setSingleShot(True)
+        self._prefs_dirty_timer.setInterval(500)
+        self._prefs_dirty_timer.timeout.connect(self._flush_prefs)
+
         # --- top bar ---
         top = QHBoxLayout()
         self.city_edit = QLineEdit(); self.city_edit.setPlaceholderText("City (e.g., Fort Myers)")
@@ -170,6 +318,7 @@ class WeatherApp(QWidget):
 
         # --- hero ---
         self.bg = QFrame(); self.bg.setObjectName("bg")
+        self.bg.setProperty("cond", "default"); self.bg.setStyleSheet(BG_QSS)
         hero = QVBoxLayout(self.bg); hero.setContentsMargins(16, 16, 16, 16)
         self.header = QLabel("—"); self.header.setAlignment(Qt.AlignCenter)
         self.subheader = QLabel(""); self.subheader.setAlignment(Qt.AlignCenter)
@@ -188,6 +337,18 @@ class WeatherApp(QWidget):
         self.daily_layout = QHBoxLayout(self.daily_strip)
         self.daily_layout.setContentsMargins(8, 0, 8, 0)
         self.daily_layout.setSpacing(8)
+        self._daily_cards: list[QFrame] = []
+        for _ in range(5):
+            card = QFrame(); card.setObjectName("dailyCard")
+            v = QVBoxLayout(card); v.setContentsMargins(10, 8, 10, 8)
+            card.l_date = QLabel(""); card.l_date.setAlignment(Qt.AlignCenter)
+            card.l_icon = QLabel(""); card.l_icon.setAlignment(Qt.AlignCenter); card.l_icon.setStyleSheet("font-size: 18pt;")
+            card.l_temp = QLabel(""); card.l_temp.setAlignment(Qt.AlignCenter)
+            for L in (card.l_date, card.l_icon, card.l_temp): v.addWidget(L)
+            card.setVisible(False)
+            self.daily_layout.addWidget(card)
+            self._daily_cards.append(card)
+        self.daily_layout.addStretch(1)
 
         # --- hourly table ---
         self.table = QTableView()
@@ -211,7 +372,9 @@ class WeatherApp(QWidget):
         # auto refresh timer (10 min)
         self.auto_timer = QTimer(self)
         self.auto_timer.setInterval(10 * 60 * 1000)
-        self.auto_timer.timeout.connect(lambda: self.fetch() if self.city_edit.text().strip() else None)
+        self.auto_timer.timeout.connect(self._auto_refresh)
+        self._auto_paused = False
+        self._last_forecast_at: float | None = None
 
         # geometry
         try:
@@ -231,23 +394,46 @@ class WeatherApp(QWidget):
         self.prefs["unit"] = "F" if self.unit_box.currentText().endswith("F") else "C"
         self._save_prefs()
 
-        url = QUrl(OPEN_METEO_GEOCODE.format(name=name))
-        reply = self.manager.get(QNetworkRequest(url))
+        key = name.lower()
+        cached = self.geocache.get(key)
+        if cached:
+            lat, lon, self._resolved_place = cached
+            self._request_forecast(lat, lon)
+            return
+
+        reply = self.manager.get(self._req(OPEN_METEO_GEOCODE.format(name=name)))
         reply.setProperty("kind", "geocode")
+        # carry the cache key on the reply; another fetch may start before it lands
+        reply.setProperty("city", key)
+
+    def _auto_refresh(self):
+        if self.isVisible() and not self.isMinimized() and self.city_edit.text().strip():
+            self.fetch()
+
+    def _req(self, url: str) -> QNetworkRequest:
+        # keep the connection warm so geocode + forecast share one TLS handshake
+        r = QNetworkRequest(QUrl(url))
+        r.setAttribute(QNetworkRequest.Http2AllowedAttribute, True)
+        r.setAttribute(QNetworkRequest.ConnectionCacheExpiryTimeoutSecondsAttribute, 120)
+        r.setRawHeader(b"Connection", b"keep-alive")
+        r.setAttribute(QNetworkRequest.CacheLoadControlAttribute, QNetworkRequest.PreferNetwork)
+        r.setAttribute(QNetworkRequest.CacheSaveControlAttribute, True)
+        return r
 
     def _on_reply(self, reply):
         kind = reply.property("kind")
         try:
-            payload = json.loads(bytes(reply.readAll()).decode("utf-8"))
+            data = reply.readAll()
+            payload = _json_loads(data.data() if hasattr(data, "data") else bytes(data))
         except Exception:
             payload = {}
         if kind == "geocode":
-            self._handle_geocode(payload)
+            self._handle_geocode(payload, reply.property("city"))
         elif kind == "forecast":
             self._handle_forecast(payload)
         reply.deleteLater()
 
-    def _handle_geocode(self, payload: dict):
+    def _handle_geocode(self, payload: dict, key: str):
         results = payload.get("results") or []
         if not results:
             QMessageBox.warning(self, "Not found", "City not found.")
@@ -257,11 +443,19 @@ class WeatherApp(QWidget):
         lat, lon = r0["latitude"], r0["longitude"]
         self._resolved_place = ", ".join([p for p in (r0.get("name"), r0.get("admin1"), r0.get("country")) if p])
 
+        # remember the lookup; oldest entry goes first once the cache is full
+        self.geocache[key] = [lat, lon, self._resolved_place]
+        while len(self.geocache) > GEOCACHE_MAX:
+            self.geocache.pop(next(iter(self.geocache)))
+        QTimer.singleShot(0, self._save_geocache)
+
+        self._request_forecast(lat, lon)
+
+    def _request_forecast(self, lat: float, lon: float):
         tunit = "fahrenheit" if self.prefs.get("unit") == "F" else "celsius"
         wunit = "mph" if tunit == "fahrenheit" else "kmh"
 
-        url = QUrl(OPEN_METEO_FORECAST.format(lat=lat, lon=lon, tunit=tunit, wunit=wunit))
-        reply = self.manager.get(QNetworkRequest(url))
+        reply = self.manager.get(self._req(OPEN_METEO_FORECAST.format(lat=lat, lon=lon, tunit=tunit, wunit=wunit)))
         reply.setProperty("kind", "forecast")
 
     def _handle_forecast(self, payload: dict):
@@ -272,39 +466,45 @@ class WeatherApp(QWidget):
         temp = current.get("temperature", 0.0)
         wind = current.get("windspeed", 0.0)
         code = int(current.get("weathercode", 0))
-        cond = self._condition_from_code(code)
+        cond = _condition_from_code(code)
         unit_letter = self.prefs.get("unit", "F")
-        self.header.setText(f"{temp:.0f}°{unit_letter} — {cond.title()}")
-        self.subheader.setText(f"Wind: {wind:.0f} {'mph' if unit_letter=='F' else 'km/h'}  |  {date.today().strftime('%A')}")
-        self.icon_lbl.setText(self._emoji_from_code(code))
+        self.header.setText(f"{_fmt_deg(round(temp))}{unit_letter} — {cond.title()}")
+        self.subheader.setText(f"Wind: {_fmt0(round(wind))} {'mph' if unit_letter=='F' else 'km/h'}  |  {date.today().strftime('%A')}")
+        self.icon_lbl.setText(_emoji_from_code(code))
         self.location_label.setText(self._resolved_place)
 
         # hourly rows (today only)
-        rows = []
         times = hourly.get("time", [])
         temps = hourly.get("temperature_2m", [])
         precs = hourly.get("precipitation_probability", [])
         winds = hourly.get("windspeed_10m", [])
         today = date.today().isoformat()
 
+        # Open-Meteo returns hourly data in order, so today is one contiguous window
+        start = next((i for i, t in enumerate(times) if t[:10] == today), None)
+        rows = []
         spark_vals = []
-        for i, t in enumerate(times):
-            try:
-                dt = datetime.fromisoformat(t)
-            except Exception:
-                continue
-            if dt.date().isoformat() != today:
-                continue
-            rows.append({
-                "time": dt.strftime("%I:%M %p").lstrip("0"),
-                "temp": float(temps[i]) if i < len(temps) else 0.0,
-                "precip": float(precs[i] or 0.0) if i < len(precs) else 0.0,
-                "wind": float(winds[i]) if i < len(winds) else 0.0,
-            })
-            if i < len(temps): spark_vals.append(float(temps[i]))
+        if start is not None:
+            end = start + 24
+            # value series may be short or missing; pad them and let `times` bound the loop
+            for t, tp, pr, wd in zip_longest(times[start:end], temps[start:end], precs[start:end], winds[start:end]):
+                if t is None:
+                    break
+                if t[:10] != today:
+                    continue
+                tp = float(tp or 0.0)
+                h = int(t[11:13])
+                rows.append({
+                    "hour": h,
+                    "time": HOUR12[h].format(m=int(t[14:16])),
+                    "temp": tp,
+                    "precip": float(pr or 0.0),
+                    "wind": float(wd or 0.0),
+                })
+                spark_vals.append(tp)
 
         self.model.load(rows)
-        self.spark.set_points([r["temp"] for r in rows] if rows else spark_vals)
+        self.spark.set_points(spark_vals)
 
         # daily (5)
         rows_daily = []
@@ -323,6 +523,7 @@ class WeatherApp(QWidget):
 
         self._apply_theme(cond)
         self.fetch_btn.setEnabled(True)
+        self._last_forecast_at = time.monotonic()
 
         # start auto refresh after first good fetch
         try:
@@ -336,58 +537,29 @@ class WeatherApp(QWidget):
         self._save_prefs()
 
     # ---------------- helpers ----------------
-    def _condition_from_code(self, code: int) -> str:
-        if code == 0: return "clear"
-        if code in (1, 2, 3): return "clouds"
-        if code in (45, 48): return "fog"
-        if 51 <= code <= 67: return "drizzle" if code < 61 else "rain"
-        if 71 <= code <= 77: return "snow"
-        if 80 <= code <= 82: return "showers"
-        if 95 <= code <= 99: return "storm"
-        return "default"
-
-    def _emoji_from_code(self, code: int) -> str:
-        if code == 0: return "☀️"
-        if code in (1,2,3): return "⛅️"
-        if code in (45,48): return "🌫️"
-        if 51 <= code <= 67: return "🌦️" if code < 61 else "🌧️"
-        if 71 <= code <= 77: return "🌨️"
-        if 80 <= code <= 82: return "🌧️"
-        if 95 <= code <= 99: return "⛈️"
-        return "🌤️"
-
     def _fill_daily_strip(self, rows_daily: list[dict]):
-        # clear previous
-        while self.daily_layout.count():
-            w = self.daily_layout.takeAt(0).widget()
-            if w: w.deleteLater()
-        for d in rows_daily:
-            card = QFrame(); card.setObjectName("dailyCard")
-            v = QVBoxLayout(card); v.setContentsMargins(10, 8, 10, 8)
-            L1 = QLabel(d.get("date","")); L1.setAlignment(Qt.AlignCenter)
-            L2 = QLabel(self._emoji_from_code(d.get("code",0))); L2.setAlignment(Qt.AlignCenter); L2.setStyleSheet("font-size: 18pt;")
-            L3 = QLabel(f"{d.get('max',0):.0f}° / {d.get('min',0):.0f}°"); L3.setAlignment(Qt.AlignCenter)
-            for L in (L1, L2, L3): v.addWidget(L)
-            self.daily_layout.addWidget(card)
-        self.daily_layout.addStretch(1)
+        # cards are built once in __init__; only their text changes here,
+        # with repaints held off so the strip lays out once at the end
+        self.daily_strip.setUpdatesEnabled(False)
+        try:
+            for i, card in enumerate(self._daily_cards):
+                if i >= len(rows_daily):
+                    card.setVisible(False)
+                    continue
+                d = rows_daily[i]
+                card.l_date.setText(d.get("date", ""))
+                card.l_icon.setText(_emoji_from_code(d.get("code", 0)))
+                card.l_temp.setText(f"{_fmt_deg(round(d.get('max', 0)))} / {_fmt_deg(round(d.get('min', 0)))}")
+                card.setVisible(True)
+        finally:
+            self.daily_strip.setUpdatesEnabled(True)
+            self.daily_strip.update()
 
     def _apply_theme(self, condition: str):
-        palettes = {
-            "clear":   "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #87CEFA, stop:1 #FFE69A)",
-            "clouds":  "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #c9d6df, stop:1 #f0f3f5)",
-            "rain":    "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #5a8bbb, stop:1 #2f4858)",
-            "drizzle": "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #9bbad1, stop:1 #6d8299)",
-            "snow":    "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #e6f2ff, stop:1 #cfe0f5)",
-            "fog":     "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #d7d7d7, stop:1 #eeeeee)",
-            "showers": "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #7393B3, stop:1 #4b6584)",
-            "storm":   "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #2b2d42, stop:1 #4b4e6d)",
-            "default": "qlineargradient(x1:0,y1:0,x2:1,y2:1, stop:0 #dde6f1, stop:1 #eef2f7)"
-        }
-        self.bg.setStyleSheet(f"""
-            QFrame#bg {{ border-radius: 12px; padding: 18px; background: {palettes.get(condition, palettes['default'])}; }}
-            QLabel {{ font-size: 22px; }}
-            QFrame#dailyCard {{ background: rgba(255,255,255,0.07); border-radius: 10px; }}
-        """)
+        # the stylesheet is installed once in __init__; swapping the property only re-polishes
+        self.bg.setProperty("cond", condition if condition in _BG_GRADIENTS else "default")
+        self.bg.style().unpolish(self.bg)
+        self.bg.style().polish(self.bg)
         self.spark.set_theme(condition)
 
     # favorites / prefs
@@ -424,13 +596,38 @@ class WeatherApp(QWidget):
     def _load_prefs(self):
         try:
             if self.prefs_path.exists():
-                self.prefs.update(json.loads(self.prefs_path.read_text()))
+                self.prefs.update(_json_loads(self.prefs_path.read_bytes()))
         except Exception:
             pass
+        try:
+            if self.geocache_path.exists():
+                raw = _json_loads(self.geocache_path.read_bytes())
+                if isinstance(raw, dict):
+                    # keep only well-formed [lat, lon, place] entries
+                    self.geocache = {
+                        k: v for k, v in raw.items()
+                        if isinstance(v, list) and len(v) == 3
+                        and all(isinstance(x, (int, float)) for x in v[:2]) and isinstance(v[2], str)
+                    }
+        except Exception:
+            self.geocache = {}
 
     def _save_prefs(self):
+        self._prefs_dirty_timer.start()
+
+    def _flush_prefs(self):
+        self._prefs_dirty_timer.stop()
+        self._write_json(self.prefs_path, self.prefs)
+
+    def _save_geocache(self):
+        self._write_json(self.geocache_path, self.geocache)
+
+    def _write_json(self, path: Path, obj):
+        # write to a temp file and swap it in so a crash never leaves a torn file
         try:
-            self.prefs_path.write_text(json.dumps(self.prefs, indent=2))
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_bytes(_json_dumps(obj))
+            os.replace(tmp, path)
         except Exception:
             pass
 
@@ -438,12 +635,41 @@ class WeatherApp(QWidget):
     def _export_png(self):
         path, _ = QFileDialog.getSaveFileName(self, "Save PNG", "dashboard.png", "PNG Files (*.png)")
         if not path: return
-        self.grab().save(path, "PNG")
-        QMessageBox.information(self, "Saved", f"Saved to {path}")
+        # grab on the GUI thread; QImage (unlike QPixmap) is safe to encode from a worker
+        job = PngSaver(self.grab().toImage(), path)
+        job.signals.done.connect(self._png_done)
+        self._png_job = job
+        self.png_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(job)
+
+    def _png_done(self, path: str, ok: bool):
+        self._png_job = None
+        self.png_btn.setEnabled(True)
+        if ok:
+            QMessageBox.information(self, "Saved", f"Saved to {path}")
+        else:
+            QMessageBox.warning(self, "Not saved", f"Could not save {path}")
+
+    # pause auto refresh while minimized so the timer doesn't wake the event loop
+    def changeEvent(self, e):
+        if e.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                if self.auto_timer.isActive():
+                    self.auto_timer.stop()
+                    self._auto_paused = True
+            elif self._auto_paused:
+                # refresh now only if the data went stale while minimized, then resume the cycle
+                self._auto_paused = False
+                age_ms = (time.monotonic() - (self._last_forecast_at or 0.0)) * 1000
+                if self._last_forecast_at is None or age_ms >= self.auto_timer.interval():
+                    QTimer.singleShot(0, self._auto_refresh)
+                self.auto_timer.start()
+        super().changeEvent(e)
 
     # save geometry
     def closeEvent(self, e):
         try:
+            self._flush_prefs()
             QSettings("COP3003", "WeatherDash").setValue("geometry", self.saveGeometry())
         finally:
             return super().closeEvent(e)